@@ -1,10 +1,27 @@
-import os
 import sys
-from tkinter.font import names
+
+
+def _enable_windows_ansi():
+    """
+    Turn on VT escape processing for the Windows console so ANSI codes render.
+    """
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_ulong()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):  # fails when stdout is not a console
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+
 
 if sys.platform == "win32":
-    os.system("")
+    try:
+        _enable_windows_ansi()
+    except (AttributeError, OSError):
+        pass
 
+_RESET = sys.intern('\033[0m')
+_ALLOWED_TYPES = frozenset({str, int, float, bool, type(None)})
 
 # === custom Exceptions ===
 
@@ -52,12 +69,14 @@ print(Colour.BLUE(None))            # “None” in blue
 fruits = ["apple","banana","cherry"]
 print(Colour.GREEN.LIST(fruits))
 print(Colour.RED.LIST(fruits, indices=[0,2]))
+print(Colour.GREEN.LIST.joined(fruits, sep=", "))   # one coloured string
 
 # 3. TupleFormatter (.TUPLE)
 
 coords = ("x","y","z")
 print(Colour.BLUE.TUPLE(coords))
 print(Colour.YELLOW.TUPLE(coords, indices=[1]))
+print(Colour.BLUE.TUPLE.joined(coords))
 
 # 4. DictFormatter (.DICT)
 
@@ -84,161 +103,285 @@ print(Colour.CYAN.TARGET("a")("AaAa"))
 print(Colour.RED.TARGET("1")([1,2,11]))
 """
 
-# === Colour Enum ===
+# === Colour ===
 
 
-from enum import Enum, member
+from functools import lru_cache
 from typing import Union
 import random
+import re
+
+_rng = random.Random()
+# (colour, formatter class) -> formatter
+_FORMATTER_CACHE = {}
 
 
-class Colour(Enum):
+@lru_cache(maxsize=128)
+def _combine_codes(first, others):
     """
-    Custom colour/styling enum-based module.
-    Provides ANSI-based foreground/background colours, text styles, and formatters.
-    For live demonstration, refer to ColourDemo.
+    Join the escape codes of a styled() call; repeated style combinations hit the cache.
     """
+    return ''.join([first._value, *[member._value for member in others]])
 
-    # foreground Colours
-    RED = '\033[31m'
-    GREEN = '\033[32m'
-    YELLOW = '\033[33m'
-    BLUE = '\033[34m'
-    CYAN = '\033[36m'
-    MAGENTA = '\033[35m'
-    WHITE = '\033[37m'
-    BLACK = '\033[30m'
-    LIGHTRED = '\033[91m'
-    LIGHTGREEN = '\033[92m'
-    LIGHTYELLOW = '\033[93m'
-    LIGHTBLUE = '\033[94m'
-    LIGHTMAGENTA = '\033[95m'
-    LIGHTCYAN = '\033[96m'
-    GREY = '\033[90m'
 
-    # background colours
-    BG_RED = '\033[41m'
-    BG_GREEN = '\033[42m'
-    BG_YELLOW = '\033[43m'
-    BG_BLUE = '\033[44m'
-    BG_CYAN = '\033[46m'
-    BG_MAGENTA = '\033[45m'
-    BG_WHITE = '\033[47m'
-    BG_BLACK = '\033[40m'
-    BG_LIGHTRED = '\033[101m'
-    BG_LIGHTGREEN = '\033[102m'
-    BG_LIGHTYELLOW = '\033[103m'
-    BG_LIGHTBLUE = '\033[104m'
-    BG_LIGHTMAGENTA = '\033[105m'
-    BG_LIGHTCYAN = '\033[106m'
-    BG_GREY = '\033[100m'
+class AnsiCode(str):
+    """
+    A single ANSI escape code. The object is the code string itself,
+    calling it styles the given text and resets formatting afterwards.
+    """
+    __slots__ = ('name', '_value')
 
-    # style Modifiers
-    BRIGHT = '\033[1m'
-    DIM = '\033[2m'
-    NORMAL = '\033[22m'
-    RESET = '\033[0m'
+    def __new__(cls, code):
+        self = super().__new__(cls, code)
+        # interned exact str copy: every formatter shares it and keeps CPython's exact-str fast paths
+        self._value = sys.intern(str(code))
+        self.name = None  # filled in by __set_name__ when assigned in a class body
+        return self
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __repr__(self):
+        if self.name is None:
+            return f"AnsiCode({str.__repr__(self)})"
+        return f"<Colour.{self.name}: {str.__repr__(self)}>"
+
+    @property
+    def value(self) -> str:
+        return self._value
 
     def __call__(self, text: Union[str, int, float, bool, None]) -> str:
         """
         Apply this colour/style to the given text.
         Automatically resets formatting after application.
         """
-        if not isinstance(text, (str, int, float, bool, type(None))):
+        if text.__class__ is str:
+            return self._value + text + _RESET
+        if type(text) not in _ALLOWED_TYPES:
             raise ColourFormatError(f"Unsupported type: {type(text).__name__}")
-        return f"{self.value}{str(text)}{Colour.RESET.value}"
+        return self._value + str(text) + _RESET
 
-    @classmethod
-    def get_supported_colours(cls, mode: Union[str, 'name', 'member',]) -> list:
+    def styled(self, text: str, *others: 'AnsiCode') -> str:
         """
-        Return supported colour enum members based on the mode:
-        - 'name': returns a list of names                    = ['RED', 'GREEN',...]
-        - 'member': returns a list of Colour enum instances  = [Colour.RED, Colour.GREEN,...]
+        Apply this colour and any additional Colour styles to the given text.
+        Returns the styled string with an ANSI reset at the end.
         """
-        skip = {'BRIGHT', 'DIM', 'NORMAL', 'RESET', 'RANDOMISE'}
-        if mode == 'member':
-            return [member for name, member in cls.__members__.items() if name not in skip]
-
-        elif mode == 'name':
-            return [name for name in cls.__members__ if name not in skip]
-
-        else:
-            raise ValueError(f"Invalid mode: {mode}")
+        return _combine_codes(self, others) + str(text) + _RESET
 
-    def styled(self, text: str, *others: 'Colour') -> str:
+    def _formatter(self, cls):
         """
-        Apply this colour and any additional Colour styles to the given text.
-        Returns the styled string with an ANSI reset at the end.
+        Return the shared formatter of the given class for this colour, creating it on first use.
         """
-        codes = ''.join(member.value for member in (self, *others))
-        return f"{codes}{text}{Colour.RESET.value}"
+        key = (self, cls)
+        formatter = _FORMATTER_CACHE.get(key)
+        if formatter is None:
+            formatter = _FORMATTER_CACHE[key] = cls(self)
+        return formatter
 
     @property
     def LIST(self):
-        return Colour._ListFormatter(self)
+        return self._formatter(Colour._ListFormatter)
 
     @property
     def TUPLE(self):
-        return Colour._TupleFormatter(self)
+        return self._formatter(Colour._TupleFormatter)
 
     @property
     def DICT(self):
-        return Colour._DictFormatter(self)
+        return self._formatter(Colour._DictFormatter)
 
     @property
     def RANDOM(self):
-        return Colour._RandomFormatter()
+        return Colour._RandomFormatter(self)
 
     def TARGET(self, *args):
         return Colour._TargetFormatter(self, args)
 
+
+class Colour:
+    """
+    Custom colour/styling module.
+    Provides ANSI-based foreground/background colours, text styles, and formatters.
+    Every colour is an AnsiCode, so Colour.RED is the escape code string itself.
+    For live demonstration, refer to ColourDemo.
+    """
+
+    # foreground Colours
+    RED = AnsiCode('\033[31m')
+    GREEN = AnsiCode('\033[32m')
+    YELLOW = AnsiCode('\033[33m')
+    BLUE = AnsiCode('\033[34m')
+    CYAN = AnsiCode('\033[36m')
+    MAGENTA = AnsiCode('\033[35m')
+    WHITE = AnsiCode('\033[37m')
+    BLACK = AnsiCode('\033[30m')
+    LIGHTRED = AnsiCode('\033[91m')
+    LIGHTGREEN = AnsiCode('\033[92m')
+    LIGHTYELLOW = AnsiCode('\033[93m')
+    LIGHTBLUE = AnsiCode('\033[94m')
+    LIGHTMAGENTA = AnsiCode('\033[95m')
+    LIGHTCYAN = AnsiCode('\033[96m')
+    GREY = AnsiCode('\033[90m')
+
+    # background colours
+    BG_RED = AnsiCode('\033[41m')
+    BG_GREEN = AnsiCode('\033[42m')
+    BG_YELLOW = AnsiCode('\033[43m')
+    BG_BLUE = AnsiCode('\033[44m')
+    BG_CYAN = AnsiCode('\033[46m')
+    BG_MAGENTA = AnsiCode('\033[45m')
+    BG_WHITE = AnsiCode('\033[47m')
+    BG_BLACK = AnsiCode('\033[40m')
+    BG_LIGHTRED = AnsiCode('\033[101m')
+    BG_LIGHTGREEN = AnsiCode('\033[102m')
+    BG_LIGHTYELLOW = AnsiCode('\033[103m')
+    BG_LIGHTBLUE = AnsiCode('\033[104m')
+    BG_LIGHTMAGENTA = AnsiCode('\033[105m')
+    BG_LIGHTCYAN = AnsiCode('\033[106m')
+    BG_GREY = AnsiCode('\033[100m')
+
+    # style Modifiers
+    BRIGHT = AnsiCode('\033[1m')
+    DIM = AnsiCode('\033[2m')
+    NORMAL = AnsiCode('\033[22m')
+    RESET = AnsiCode('\033[0m')
+
+    @classmethod
+    def get_supported_colours(cls, mode: Union[str, 'name', 'member',]) -> list:
+        """
+        Return supported colours based on the mode:
+        - 'name': returns a list of names                    = ['RED', 'GREEN',...]
+        - 'member': returns a list of AnsiCode instances     = [Colour.RED, Colour.GREEN,...]
+        """
+        if mode == 'member':
+            return list(_SUPPORTED_MEMBERS)
+
+        elif mode == 'name':
+            return list(_SUPPORTED_NAMES)
+
+        else:
+            raise ValueError(f"Invalid mode: {mode}")
+
     @staticmethod
     def USAGE_DETAIL() -> str:
-        return print(USAGE_DETAIL_TEXT)
+        """
+        Return the detailed usage examples; print the result to show them.
+        """
+        return USAGE_DETAIL_TEXT
 
 
     class _TargetFormatter:
         def __init__(self, colour, targets):
             self.colour = colour
+            self._code = colour.value
             self.targets = set(str(t) for t in targets)
+            wrapped = {t: f"{self._code}{t}{_RESET}" for t in self.targets if t}
+            if all(len(t) == 1 for t in wrapped):
+                self._table = {ord(t): w for t, w in wrapped.items()}
+                self._pattern = None
+            else:
+                # longest first, so "ab" wins over "a" at the same position
+                alternatives = sorted(wrapped, key=len, reverse=True)
+                self._pattern = re.compile("|".join(map(re.escape, alternatives)))
+                # a template keeps the substitution inside the re engine, no callback per match
+                self._template = self._code + r"\g<0>" + _RESET
 
         def __call__(self, text):
-            return ''.join(
-                f"{self.colour.value}{c}{Colour.RESET.value}" if c in self.targets else c
-                for c in str(text)
-            )
+            if self._pattern is None:
+                return str(text).translate(self._table)
+            return self._pattern.sub(self._template, str(text))
+
+    class _JoinedMixin:
+        """
+        Shared joined() for the list and tuple formatters; _kind names the container in errors.
+        """
+
+        def joined(self, items, sep=" "):
+            """Colour every item and join them with sep into a single string."""
+            if not isinstance(sep, str):
+                raise ColourFormatError("Separator must be a string.")
+            if not isinstance(items, (list, tuple)):
+                items = list(items)  # generators are always truthy, materialise before the empty check
+            if not items:
+                return ""
+            code = self._code
+            try:
+                return code + (_RESET + sep + code).join(items) + _RESET
+            except TypeError:
+                raise ColourFormatError(f"All {self._kind} items must be strings.") from None
+
+    class _ListFormatter(_JoinedMixin):
+        _kind = "list"
 
-    class _ListFormatter:
         def __init__(self, colour):
             self.colour = colour
+            self._code = colour.value
 
         def __call__(self, items, indices=None):
-            if not all(isinstance(i, str) for i in items):
-                raise ColourFormatError("All list items must be strings.")
-            if indices is None:
-                return [self.colour(i) for i in items]
-            for idx in indices:
-                if idx < 0 or idx >= len(items):
-                    raise ListIndexOutOfRange(f"Index {idx} out of range.")
-            return [self.colour(i) if idx in indices else i for idx, i in enumerate(items)]
-
-    class _TupleFormatter:
+            idx_set = None
+            if indices is not None:
+                indices = tuple(indices)  # iterators are read again below to report the bad index
+                idx_set = frozenset(indices)
+            code = self._code
+            reset = _RESET
+            out = []
+            append = out.append
+            if idx_set is None:
+                # every item is wrapped, so skip enumerate and the per-item index test
+                for i in items:
+                    if not isinstance(i, str):
+                        raise ColourFormatError("All list items must be strings.")
+                    append(f"{code}{i}{reset}")
+            else:
+                for idx, i in enumerate(items):
+                    if not isinstance(i, str):
+                        raise ColourFormatError("All list items must be strings.")
+                    append(f"{code}{i}{reset}" if idx in idx_set else i)
+                # bounds are checked after the pass so a bad item type is still reported first
+                if idx_set and (min(idx_set) < 0 or max(idx_set) >= len(out)):
+                    for idx in indices:
+                        if idx < 0 or idx >= len(out):
+                            raise ListIndexOutOfRange(f"Index {idx} out of range.")
+            return out
+
+    class _TupleFormatter(_JoinedMixin):
+        _kind = "tuple"
+
         def __init__(self, colour):
             self.colour = colour
+            self._code = colour.value
 
         def __call__(self, items, indices=None):
-            if not all(isinstance(i, str) for i in items):
-                raise ColourFormatError("All tuple items must be strings.")
-            if indices is None:
-                return tuple(self.colour(i) for i in items)
-            for idx in indices:
-                if idx < 0 or idx >= len(items):
-                    raise ListIndexOutOfRange(f"Index {idx} out of range.")
-            return tuple(self.colour(i) if idx in indices else i for idx, i in enumerate(items))
+            idx_set = None
+            if indices is not None:
+                indices = tuple(indices)  # iterators are read again below to report the bad index
+                idx_set = frozenset(indices)
+            code = self._code
+            reset = _RESET
+            out = []
+            append = out.append
+            if idx_set is None:
+                # every item is wrapped, so skip enumerate and the per-item index test
+                for i in items:
+                    if not isinstance(i, str):
+                        raise ColourFormatError("All tuple items must be strings.")
+                    append(f"{code}{i}{reset}")
+            else:
+                for idx, i in enumerate(items):
+                    if not isinstance(i, str):
+                        raise ColourFormatError("All tuple items must be strings.")
+                    append(f"{code}{i}{reset}" if idx in idx_set else i)
+                # bounds are checked after the pass so a bad item type is still reported first
+                if idx_set and (min(idx_set) < 0 or max(idx_set) >= len(out)):
+                    for idx in indices:
+                        if idx < 0 or idx >= len(out):
+                            raise ListIndexOutOfRange(f"Index {idx} out of range.")
+            return tuple(out)
 
     class _DictFormatter:
         def __init__(self, colour):
             self.colour = colour
+            self._code = colour.value
 
         def __call__(self, items, keys=None, values=None, target="value"):
             if not all(isinstance(k, str) for k in items):
@@ -250,57 +393,93 @@ class Colour(Enum):
                     if k not in items:
                         raise DictKeyMissing(f"Key '{k}' missing.")
             if values:
-                for v in values:
-                    if v not in items.values():
-                        raise DictValueMissing(f"Value '{v}' missing.")
-            out = {}
-            for k, v in items.items():
-                k_ok = keys is None or k in keys
-                v_ok = values is None or v in values
-                if target == "key":
-                    out[self.colour(k) if k_ok else k] = v
-                elif target == "value":
-                    out[k] = self.colour(v) if v_ok else v
-                else:
-                    out[self.colour(k) if k_ok else k] = self.colour(v) if v_ok else v
-            return out
-
-        class _RandomFormatter:
-            def __init__(self, Colour):
-                self.colour = Colour
+                try:
+                    present = set(items.values())
+                    missing = [v for v in values if v not in present]
+                except TypeError:
+                    # unhashable values cannot go in a set, fall back to a linear scan
+                    present = list(items.values())
+                    missing = [v for v in values if v not in present]
+                if missing:
+                    raise DictValueMissing(f"Value '{missing[0]}' missing.")
+            keys_set = None if keys is None else frozenset(keys)
+            if values is None:
+                return self._build(items, keys_set, None, target)
+            try:
+                return self._build(items, keys_set, frozenset(values), target)
+            except TypeError:
+                # an unhashable value cannot be looked up in a set, scan the list instead
+                return self._build(items, keys_set, list(values), target)
+
+        def _build(self, items, keys_set, values_set, target):
+            # keys are validated as strings in __call__; values still go through Colour.__call__
+            code = self._code
+            reset = _RESET
+            colour = self.colour.__call__
+            if target == "key":
+                return {
+                    f"{code}{k}{reset}" if keys_set is None or k in keys_set else k: v
+                    for k, v in items.items()
+                }
+            if target == "value":
+                return {
+                    k: colour(v) if values_set is None or v in values_set else v
+                    for k, v in items.items()
+                }
+            return {
+                (f"{code}{k}{reset}" if keys_set is None or k in keys_set else k):
+                    (colour(v) if values_set is None or v in values_set else v)
+                for k, v in items.items()
+            }
+
+    class _RandomFormatter:
+        def __init__(self, colour):
+            self.colour = colour
 
-            @property
-            def _pool(self):
-                return Colour.get_supported_colours('member')
+        def pick(self, pool=None, _randrange=_rng.randrange):
+            if pool is None:
+                pool = _SUPPORTED_MEMBERS
+            elif isinstance(pool, AnsiCode):
+                raise ColourFormatError("Pool must be a sequence of colours, not a single colour.")
+            return pool[_randrange(len(pool))]
 
-            def pick(self, pool=None):
-                return random.choice(pool or self._pool)
+        def SINGLE(self, v, c=None):
+            return self.pick(c)(v)
 
-            def SINGLE(self, v, c=None):
-                return self.pick(c)(v)
+        def LIST(self, items, indices=None, c=None):
+            return self.pick(c).LIST(items, indices)
 
-            def LIST(self, items, indices=None, c=None):
-                return self.pick(c).LIST(items, indices)
+        def TUPLE(self, items, indices=None, c=None):
+            return self.pick(c).TUPLE(items, indices)
 
-            def TUPLE(self, items, indices=None, c=None):
-                return self.pick(c).TUPLE(items, indices)
+        def DICT(self, items, keys=None, values=None, target="value", c=None):
+            return self.pick(c).DICT(items, keys, values, target)
 
-            def DICT(self, items, keys=None, values=None, target="value", c=None):
-                return self.pick(c).DICT(items, keys, values, target)
+        def RANDOM(self, v, c=None):
+            return self.pick(c)(v)
 
-            def RANDOM(self, v, c=None):
-                return self.pick(c)(v)
+        def __call__(self, v, c=None):
+            return self.SINGLE(v, c)
 
-            def __call__(self, v, c=None):
-                return self.SINGLE(v, c)
-
-            def __repr__(self):
-                return ""
+        def __repr__(self):
+            return ""
 
     class _RandomiseFormater:
         def __init__(self, colour):
             self.colour = colour
         pass
+
+    RANDOMISE = _RandomFormatter(None)
+
+
+# supported colours are fixed once the class is built, so compute them at import
+_SKIP = frozenset({'BRIGHT', 'DIM', 'NORMAL', 'RESET'})
+_SUPPORTED_MEMBERS = tuple(
+    code for name, code in vars(Colour).items() if isinstance(code, AnsiCode) and name not in _SKIP
+)
+_SUPPORTED_NAMES = tuple(code.name for code in _SUPPORTED_MEMBERS)
+
+
 # ============================================DEMO========================================================#
 class ColourDemo:
     """
@@ -527,18 +706,27 @@ class ColourDemo:
         if isinstance(value, (list, tuple)):
             print(f"{styled_label('FULL')} → {truncate_repr(value)}")
             print(f"{styled_label('ITEMS')}:")
-            ansi_reprs = [truncate_repr(item) for item in value]
-            width = max(len(s) for s in ansi_reprs) if ansi_reprs else 0
+            ansi_reprs = []
+            width = 0
+            for item in value:
+                ansi = truncate_repr(item)
+                ansi_reprs.append(ansi)
+                if len(ansi) > width:
+                    width = len(ansi)
             for item, ansi in zip(value, ansi_reprs):
                 print(f"{ansi.ljust(width)} → {item}")
 
         elif isinstance(value, dict):
             print(f"{styled_label('FULL')} → {truncate_repr(value)}")
             print(f"{styled_label('DICT ITEMS')}:")
-            ansi_reprs = {k: truncate_repr(v) for k, v in value.items()}
-            width = max(len(s) for s in ansi_reprs.values()) if ansi_reprs else 0
+            ansi_reprs = []
+            width = 0
             for k, v in value.items():
-                ansi = ansi_reprs[k]
+                ansi = truncate_repr(v)
+                ansi_reprs.append((k, ansi))
+                if len(ansi) > width:
+                    width = len(ansi)
+            for k, ansi in ansi_reprs:
                 print(f"{ansi.ljust(width)} → {k}")
 
         else:
@@ -1 +1,167 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from enum import IntEnum
 
+from colour_module import (
+    AnsiCode, Colour, ColourFormatError, DictValueMissing, ListIndexOutOfRange, USAGE_DETAIL_TEXT,
+)
+
+
+class AnsiCodeTest(unittest.TestCase):
+
+    def test_repr(self):
+        self.assertEqual(repr(Colour.RED), "<Colour.RED: '\\x1b[31m'>")
+        self.assertEqual(repr(AnsiCode('\033[1m')), "AnsiCode('\\x1b[1m')")
+
+    def test_name_and_value(self):
+        self.assertEqual(Colour.RED.name, "RED")
+        self.assertEqual(Colour.RED.value, "\033[31m")
+        self.assertIs(type(Colour.RED.value), str)
+
+    def test_call_with_scalars(self):
+        for value, text in ((123, "123"), (3.14, "3.14"), (True, "True"), (None, "None"), ("Error", "Error")):
+            self.assertEqual(Colour.YELLOW(value), f"\033[33m{text}\033[0m")
+
+    def test_rejects_unsupported_types(self):
+        class Text(str):
+            pass
+
+        class Number(IntEnum):
+            ONE = 1
+
+        for value in ([1], Text("a"), Number.ONE):
+            with self.assertRaises(ColourFormatError):
+                Colour.RED(value)
+
+    def test_supported_colours(self):
+        names = [
+            'RED', 'GREEN', 'YELLOW', 'BLUE', 'CYAN', 'MAGENTA', 'WHITE', 'BLACK',
+            'LIGHTRED', 'LIGHTGREEN', 'LIGHTYELLOW', 'LIGHTBLUE', 'LIGHTMAGENTA', 'LIGHTCYAN', 'GREY',
+            'BG_RED', 'BG_GREEN', 'BG_YELLOW', 'BG_BLUE', 'BG_CYAN', 'BG_MAGENTA', 'BG_WHITE', 'BG_BLACK',
+            'BG_LIGHTRED', 'BG_LIGHTGREEN', 'BG_LIGHTYELLOW', 'BG_LIGHTBLUE', 'BG_LIGHTMAGENTA', 'BG_LIGHTCYAN',
+            'BG_GREY',
+        ]
+        self.assertEqual(Colour.get_supported_colours("name"), names)
+        self.assertEqual(Colour.get_supported_colours("member"), [getattr(Colour, name) for name in names])
+        with self.assertRaises(ValueError):
+            Colour.get_supported_colours("bad")
+
+    def test_usage_detail_returns_text_without_printing(self):
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertIs(Colour.USAGE_DETAIL(), USAGE_DETAIL_TEXT)
+        self.assertEqual(out.getvalue(), "")
+
+
+class TargetFormatterTest(unittest.TestCase):
+
+    def test_single_char_targets(self):
+        self.assertEqual(Colour.CYAN.TARGET("a")("AaAa"), f"A{Colour.CYAN('a')}A{Colour.CYAN('a')}")
+
+    def test_non_str_targets_and_text(self):
+        red_1 = Colour.RED("1")
+        self.assertEqual(Colour.RED.TARGET(1)([1, 2, 11]), f"[{red_1}, 2, {red_1}{red_1}]")
+
+    def test_longest_target_wins(self):
+        self.assertEqual(Colour.RED.TARGET("ab")("abc"), f"{Colour.RED('ab')}c")
+        self.assertEqual(Colour.RED.TARGET("a", "ab")("xaby a"), f"x{Colour.RED('ab')}y {Colour.RED('a')}")
+
+    def test_empty_target_never_matches(self):
+        self.assertEqual(Colour.RED.TARGET("")("abc"), "abc")
+        self.assertEqual(Colour.RED.TARGET("", "bc")("abc"), f"a{Colour.RED('bc')}")
+
+    def test_regex_metacharacters_and_backslash(self):
+        self.assertEqual(Colour.RED.TARGET(".")("a.b"), f"a{Colour.RED('.')}b")
+        backslash = "\\"
+        # "a." must only match literally, so the trailing "ab" stays plain
+        self.assertEqual(
+            Colour.RED.TARGET("a.", backslash)(f"a.b{backslash}ab"),
+            f"{Colour.RED('a.')}b{Colour.RED(backslash)}ab",
+        )
+
+
+class SequenceFormatterTest(unittest.TestCase):
+
+    def test_item_type_error_wins_over_bad_index(self):
+        with self.assertRaises(ColourFormatError):
+            Colour.RED.LIST(["a", 1], indices=[5])
+        with self.assertRaises(ColourFormatError):
+            Colour.RED.TUPLE(("a", 1), indices=[5])
+
+    def test_index_out_of_range(self):
+        with self.assertRaisesRegex(ListIndexOutOfRange, "Index 5 out of range"):
+            Colour.RED.LIST(["a", "b"], indices=[0, 5])
+        with self.assertRaisesRegex(ListIndexOutOfRange, "Index -1 out of range"):
+            Colour.RED.TUPLE(("a", "b"), indices=[-1])
+
+    def test_empty_indices(self):
+        self.assertEqual(Colour.RED.LIST(["a", "b"], indices=[]), ["a", "b"])
+        self.assertEqual(Colour.RED.TUPLE(("a", "b"), indices=[]), ("a", "b"))
+
+    def test_iterator_indices(self):
+        self.assertEqual(Colour.RED.LIST(["a", "b"], indices=iter([1])), ["a", Colour.RED("b")])
+        with self.assertRaisesRegex(ListIndexOutOfRange, "Index 5 out of range"):
+            Colour.RED.LIST(["a", "b"], indices=iter([5]))
+        with self.assertRaisesRegex(ListIndexOutOfRange, "Index 5 out of range"):
+            Colour.RED.TUPLE(("a", "b"), indices=(i for i in [5]))
+
+
+class JoinedTest(unittest.TestCase):
+
+    def test_matches_joined_list(self):
+        fruits = ["apple", "banana"]
+        self.assertEqual(Colour.GREEN.LIST.joined(fruits, sep=", "), ", ".join(Colour.GREEN.LIST(fruits)))
+        self.assertEqual(Colour.BLUE.TUPLE.joined(tuple(fruits)), " ".join(Colour.BLUE.TUPLE(tuple(fruits))))
+
+    def test_empty_input(self):
+        for formatter in (Colour.GREEN.LIST, Colour.GREEN.TUPLE):
+            self.assertEqual(formatter.joined([]), "")
+            self.assertEqual(formatter.joined(i for i in ()), "")
+
+    def test_generator_input(self):
+        self.assertEqual(Colour.GREEN.LIST.joined(i for i in ["a", "b"]), Colour.GREEN.LIST.joined(["a", "b"]))
+
+    def test_invalid_items_and_separator(self):
+        with self.assertRaisesRegex(ColourFormatError, "items must be strings"):
+            Colour.GREEN.LIST.joined(["a", 1])
+        with self.assertRaisesRegex(ColourFormatError, "All tuple items must be strings"):
+            Colour.GREEN.TUPLE.joined(("a", 1))
+        with self.assertRaisesRegex(ColourFormatError, "Separator"):
+            Colour.GREEN.TUPLE.joined(("a", "b"), sep=1)
+
+
+class RandomFormatterTest(unittest.TestCase):
+
+    def test_randomise_uses_a_supported_colour(self):
+        options = {member("x") for member in Colour.get_supported_colours("member")}
+        self.assertIn(Colour.RANDOMISE("x"), options)
+        self.assertIn(Colour.RED.RANDOM("x"), options)
+
+    def test_pool(self):
+        self.assertEqual(Colour.RANDOMISE("x", c=[Colour.RED]), Colour.RED("x"))
+        self.assertEqual(Colour.RANDOMISE.LIST(["a", "b"], indices=[1], c=[Colour.RED]), ["a", Colour.RED("b")])
+        self.assertEqual(Colour.RANDOMISE.TUPLE(("a",), c=(Colour.BLUE,)), (Colour.BLUE("a"),))
+        self.assertEqual(Colour.RANDOMISE.DICT({"k": "v"}, c=[Colour.GREEN]), {"k": Colour.GREEN("v")})
+
+    def test_single_colour_pool_is_rejected(self):
+        with self.assertRaisesRegex(ColourFormatError, "Pool must be a sequence"):
+            Colour.RANDOMISE("x", c=Colour.RED)
+
+
+class DictFormatterTest(unittest.TestCase):
+
+    def test_values_filter_with_unhashable_value(self):
+        data = {"a": "x", "b": [1]}
+        self.assertEqual(
+            Colour.RED.DICT(data, values=["x"], target="key"),
+            {Colour.RED("a"): "x", Colour.RED("b"): [1]},
+        )
+        self.assertEqual(Colour.RED.DICT(data, values=["x"]), {"a": Colour.RED("x"), "b": [1]})
+
+    def test_missing_value_with_unhashable_value(self):
+        with self.assertRaises(DictValueMissing):
+            Colour.RED.DICT({"a": "x", "b": [1]}, values=["y"])
+
+
+if __name__ == "__main__":
+    unittest.main()